@@ -3,16 +3,43 @@ import os
 import re
 import sys
 import argparse
+import textwrap
+import zlib
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, parse_qs
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfdoc
 from reportlab.lib.units import mm
-from reportlab.lib.utils import ImageReader
-from langdetect import detect, LangDetectException
-import matplotlib.pyplot as plt
-from io import BytesIO
+from reportlab.lib import colors
+from reportlab.graphics import renderPDF
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.piecharts import Pie
+from langdetect import DetectorFactory, detect, LangDetectException
+
+# langdetect is randomized per call; a fixed seed gives the same answer for the same text,
+# including across the worker processes used by analyze_comments.
+DetectorFactory.seed = 0
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 # ----------------- Utilities -----------------
 
@@ -44,8 +71,21 @@ def extract_youtube_id(url: str) -> str:
 
 # ----------------- Fetchers -----------------
 
-def fetch_youtube_comments(video_id: str, api_key: str, max_results: int = 100) -> list:
-    """Fetch comments from a YouTube video using the API."""
+# One pooled session so paginated API calls reuse the same TCP/TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=50))
+
+def _json_body(r: requests.Response) -> dict:
+    """Decode an API response body, with orjson when it is installed."""
+    if orjson is None:
+        return r.json()
+    try:
+        return orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        return r.json()  # orjson rejects lone-surrogate escapes that the json module accepts
+
+def fetch_youtube_comments(video_id: str, api_key: str, max_results: int = 100, on_page=None) -> list:
+    """Fetch comments from a YouTube video using the API, passing each page to on_page as it arrives."""
     if not api_key:
         print("⚠️ [YouTube] No API key provided. Try setting YOUTUBE_API_KEY.")
         return []
@@ -55,28 +95,36 @@ def fetch_youtube_comments(video_id: str, api_key: str, max_results: int = 100)
         "part": "snippet",
         "videoId": video_id,
         "textFormat": "plainText",
-        "maxResults": min(max_results, 100),
         "key": api_key,
     }
     try:
-        r = requests.get(url, params=params, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        for item in data.get("items", []):
-            s = item["snippet"]["topLevelComment"]["snippet"]
-            comments.append({
-                "author": s.get("authorDisplayName", "Unknown"),
-                "text": s.get("textDisplay", ""),
-                "publishedAt": s.get("publishedAt", ""),
-                "likeCount": s.get("likeCount", 0),
-                "platform": "youtube",
-            })
+        while len(comments) < max_results:
+            params["maxResults"] = min(max_results - len(comments), 100)
+            r = _SESSION.get(url, params=params, timeout=15)
+            r.raise_for_status()
+            data = _json_body(r)
+            page = []
+            for item in data.get("items", []):
+                s = item["snippet"]["topLevelComment"]["snippet"]
+                page.append({
+                    "author": s.get("authorDisplayName", "Unknown"),
+                    "text": s.get("textDisplay", ""),
+                    "publishedAt": s.get("publishedAt", ""),
+                    "likeCount": s.get("likeCount", 0),
+                    "platform": "youtube",
+                })
+            comments.extend(page)
+            if on_page and page:
+                on_page(page)
+            if not data.get("nextPageToken"):
+                break
+            params["pageToken"] = data["nextPageToken"]
     except Exception as e:
         print(f"❌ [YouTube] Error fetching comments: {e}")
     return comments
 
-def fetch_facebook_comments(object_id: str, access_token: str, max_results: int = 100) -> list:
-    """Fetch comments from a Facebook post using the Graph API."""
+def fetch_facebook_comments(object_id: str, access_token: str, max_results: int = 100, on_page=None) -> list:
+    """Fetch comments from a Facebook post using the Graph API, passing each page to on_page as it arrives."""
     if not access_token:
         print("⚠️ [Facebook] No access token provided. Try setting FACEBOOK_ACCESS_TOKEN.")
         return []
@@ -88,23 +136,30 @@ def fetch_facebook_comments(object_id: str, access_token: str, max_results: int
         "filter": "stream",
     }
     try:
-        r = requests.get(url, params=params, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        for item in data.get("data", []):
-            comments.append({
-                "author": item.get("from", {}).get("name", "Unknown"),
-                "text": item.get("message", ""),
-                "publishedAt": item.get("created_time", ""),
-                "likeCount": item.get("like_count", 0),
-                "platform": "facebook",
-            })
+        while url and len(comments) < max_results:
+            r = _SESSION.get(url, params=params, timeout=15)
+            r.raise_for_status()
+            data = _json_body(r)
+            page = []
+            for item in data.get("data", [])[:max_results - len(comments)]:
+                page.append({
+                    "author": item.get("from", {}).get("name", "Unknown"),
+                    "text": item.get("message", ""),
+                    "publishedAt": item.get("created_time", ""),
+                    "likeCount": item.get("like_count", 0),
+                    "platform": "facebook",
+                })
+            comments.extend(page)
+            if on_page and page:
+                on_page(page)
+            # The Graph API's paging.next URL already carries the token and query.
+            url, params = data.get("paging", {}).get("next"), None
     except Exception as e:
         print(f"❌ [Facebook] Error fetching comments: {e}")
     return comments
 
-def fetch_instagram_comments(media_id: str, access_token: str, max_results: int = 100) -> list:
-    """Fetch comments from an Instagram post using the Graph API."""
+def fetch_instagram_comments(media_id: str, access_token: str, max_results: int = 100, on_page=None) -> list:
+    """Fetch comments from an Instagram post using the Graph API, passing each page to on_page as it arrives."""
     if not access_token:
         print("⚠️ [Instagram] No access token provided. Try setting FACEBOOK_ACCESS_TOKEN.")
         return []
@@ -115,22 +170,28 @@ def fetch_instagram_comments(media_id: str, access_token: str, max_results: int
         "limit": min(max_results, 100),
     }
     try:
-        r = requests.get(url, params=params, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        for item in data.get("data", []):
-            comments.append({
-                "author": item.get("username", item.get("from", {}).get("name", "Unknown")),
-                "text": item.get("text", item.get("message", "")),
-                "publishedAt": item.get("timestamp", ""),
-                "likeCount": item.get("like_count", 0),
-                "platform": "instagram",
-            })
+        while url and len(comments) < max_results:
+            r = _SESSION.get(url, params=params, timeout=15)
+            r.raise_for_status()
+            data = _json_body(r)
+            page = []
+            for item in data.get("data", [])[:max_results - len(comments)]:
+                page.append({
+                    "author": item.get("username", item.get("from", {}).get("name", "Unknown")),
+                    "text": item.get("text", item.get("message", "")),
+                    "publishedAt": item.get("timestamp", ""),
+                    "likeCount": item.get("like_count", 0),
+                    "platform": "instagram",
+                })
+            comments.extend(page)
+            if on_page and page:
+                on_page(page)
+            url, params = data.get("paging", {}).get("next"), None
     except Exception as e:
         print(f"❌ [Instagram] Error fetching comments: {e}")
     return comments
 
-def fetch_x_comments(tweet_id: str, bearer_token: str, max_results: int = 100) -> list:
+def fetch_x_comments(tweet_id: str, bearer_token: str, max_results: int = 100, on_page=None) -> list:
     """Placeholder for fetching X/Twitter comments (requires elevated API access)."""
     if not bearer_token:
         print("⚠️ [X/Twitter] No bearer token provided. Try setting TWITTER_BEARER_TOKEN.")
@@ -138,7 +199,7 @@ def fetch_x_comments(tweet_id: str, bearer_token: str, max_results: int = 100) -
     print("ℹ️ [X/Twitter] Fetching replies requires Twitter API v2 elevated access. Using demo mode.")
     return []
 
-def fetch_linkedin_comments(urn: str, access_token: str, max_results: int = 100) -> list:
+def fetch_linkedin_comments(urn: str, access_token: str, max_results: int = 100, on_page=None) -> list:
     """Placeholder for fetching LinkedIn comments (requires specific API permissions)."""
     print("ℹ️ [LinkedIn] LinkedIn API fetching not implemented (requires app + permissions). Using demo mode.")
     return []
@@ -179,35 +240,62 @@ def load_sample_comments(platform: str) -> list:
 
 # ----------------- CSV Reader -----------------
 
+# Every header name read_comments_csv looks at; Arrow must keep these as text, not infer types.
+_CSV_COLUMNS = ('author', 'user', 'username', 'text', 'comment', 'publishedAt', 'time', 'likeCount', 'likes', 'platform')
+
+def _read_csv_rows_arrow(path: str) -> list:
+    """Parse a headed CSV with pyarrow's multithreaded reader; None if pyarrow is missing or can't parse it."""
+    if pa is None:
+        return None
+    try:
+        table = pa_csv.read_csv(
+            path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(_CSV_COLUMNS, pa.string())),
+        )
+    except (pa.ArrowInvalid, UnicodeDecodeError):
+        return None
+    return table.to_pylist()
+
+def _comment_from_csv_row(row: dict) -> dict:
+    """Map a CSV row, under any of the supported header aliases, to a comment dict."""
+    return {
+        'author': row.get('author') or row.get('user') or row.get('username') or 'Unknown',
+        'text': row.get('text') or row.get('comment') or '',
+        'publishedAt': row.get('publishedAt') or row.get('time') or '',
+        'likeCount': int(row.get('likeCount') or row.get('likes') or 0),
+        'platform': row.get('platform') or 'unknown'
+    }
+
 def read_comments_csv(path: str) -> list:
     """Read comments from a CSV file with columns: author,text,publishedAt,likeCount,platform."""
     import csv
     comments = []
     try:
-        with open(path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames is None:
-                f.seek(0)
-                for ln in f:
-                    parts = ln.strip().split(',')
-                    if len(parts) < 2:
-                        continue
-                    comments.append({
-                        'author': parts[0].strip(),
-                        'text': parts[1].strip(),
-                        'publishedAt': parts[2].strip() if len(parts) > 2 else '',
-                        'likeCount': int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0,
-                        'platform': parts[4].strip() if len(parts) > 4 else 'unknown'
-                    })
-            else:
-                for row in reader:
-                    comments.append({
-                        'author': row.get('author') or row.get('user') or row.get('username') or 'Unknown',
-                        'text': row.get('text') or row.get('comment') or '',
-                        'publishedAt': row.get('publishedAt') or row.get('time') or '',
-                        'likeCount': int(row.get('likeCount') or row.get('likes') or 0),
-                        'platform': row.get('platform') or 'unknown'
-                    })
+        rows = _read_csv_rows_arrow(path)
+        if rows is not None:
+            for row in rows:
+                comments.append(_comment_from_csv_row(row))
+        else:
+            # Empty, ragged or headerless files, or no pyarrow installed.
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames is None:
+                    f.seek(0)
+                    for ln in f:
+                        parts = ln.strip().split(',')
+                        if len(parts) < 2:
+                            continue
+                        comments.append({
+                            'author': parts[0].strip(),
+                            'text': parts[1].strip(),
+                            'publishedAt': parts[2].strip() if len(parts) > 2 else '',
+                            'likeCount': int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0,
+                            'platform': parts[4].strip() if len(parts) > 4 else 'unknown'
+                        })
+                else:
+                    for row in reader:
+                        comments.append(_comment_from_csv_row(row))
         print(f"✅ [CSV] Successfully loaded {len(comments)} comments from {path}")
     except Exception as e:
         print(f"❌ [CSV] Error reading file: {e}")
@@ -215,67 +303,218 @@ def read_comments_csv(path: str) -> list:
 
 # ----------------- Analyzer -----------------
 
+_LID_MODEL_PATH = os.getenv('FASTTEXT_LID_MODEL', 'lid.176.ftz')
+_LID = None
+
+def _load_lid():
+    """Load the fastText language-ID model once; False if it is unavailable."""
+    global _LID
+    if _LID is None:
+        _LID = False
+        # Without the model file, fasttext would only print a load_model warning before failing.
+        if os.path.exists(_LID_MODEL_PATH):
+            try:
+                import fasttext
+                _LID = fasttext.load_model(_LID_MODEL_PATH)
+            except Exception:
+                pass
+    return _LID
+
+def _fasttext_labels(lid, texts: list) -> list:
+    """Predict one language label per text in a single fastText call."""
+    labels, _ = lid.predict([t.replace('\n', ' ') for t in texts], k=1)
+    return [l[0].replace('__label__', '') if l else 'unknown' for l in labels]
+
+def _fasttext_ok(text: str) -> bool:
+    """Whether fastText can take a text; lone surrogates (a truncated emoji from an API) cannot be encoded."""
+    try:
+        text.encode('utf-8')
+    except UnicodeEncodeError:
+        return False
+    return True
+
+@lru_cache(maxsize=8192)
 def detect_language(text: str) -> str:
-    """Detect the language of a text string."""
+    """Detect the language of a text string; repeated texts are answered from a bounded cache."""
+    if len(text) < 3:
+        return 'unknown'  # Too short for either detector to say anything reliable
+    lid = _load_lid()
+    if lid and _fasttext_ok(text):
+        return _fasttext_labels(lid, [text])[0]
     try:
         return detect(text)
     except LangDetectException:
         return 'unknown'
 
-def analyze_comment(comment: dict) -> dict:
+def detect_language_batch(texts: list) -> list:
+    """Detect the language of many texts, using one fastText call for the distinct ones when available."""
+    lid = _load_lid()
+    if not lid:
+        return [detect_language(t) for t in texts]
+    distinct = [t for t in dict.fromkeys(texts) if len(t) >= 3 and _fasttext_ok(t)]
+    labels = dict(zip(distinct, _fasttext_labels(lid, distinct))) if distinct else {}
+    # Texts fastText was not given fall back to detect_language (langdetect, or 'unknown' if too short).
+    return [labels[t] if t in labels else detect_language(t) for t in texts]
+
+_URL_RE = re.compile(r'https?://|www\.')
+_PHONE_RE = re.compile(r'\b\d{7,}\b')
+_PUNCT_RE = re.compile(r'[!?.]{3,}')
+_REPEAT_RE = re.compile(r'(.)\1{6,}')
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001F6FF\U0001F900-\U0001F9FF\u2600-\u27BF]')
+_PROMO_RE = re.compile(r'follow me|check my profile|subscribe|dm for|contact me|visit my', re.IGNORECASE)
+# Yes/no text probes scanned together in one pass when hyperscan is available.
+# _PHONE_RE and _REPEAT_RE stay separate: hyperscan lacks Unicode \b and backreferences.
+_PROBE_URL, _PROBE_PUNCT, _PROBE_PROMO = 1, 2, 3
+_TEXT_PROBES = {_PROBE_URL: _URL_RE, _PROBE_PUNCT: _PUNCT_RE, _PROBE_PROMO: _PROMO_RE}
+
+_USERDIGIT_RE = re.compile(r'user\d{2,}', re.IGNORECASE)
+_BOTNAME_RE = re.compile(r'bot|spam|free|promo', re.IGNORECASE)
+
+def _build_probe_db():
+    """Compile the text probes into a single hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        base_flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        db.compile(
+            expressions=[p.pattern.encode() for p in _TEXT_PROBES.values()],
+            ids=list(_TEXT_PROBES),
+            flags=[base_flags | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                   for p in _TEXT_PROBES.values()],
+        )
+        return db
+    except Exception:
+        return None
+
+_PROBE_DB = _build_probe_db()
+
+def scan_text_probes(text: str) -> set:
+    """Return the ids of the text probes that match anywhere in the text."""
+    try:
+        # Lone surrogates (e.g. a truncated emoji from an API) cannot be encoded for hyperscan.
+        data = text.encode('utf-8') if _PROBE_DB is not None else None
+    except UnicodeEncodeError:
+        data = None
+    if data is None:
+        return {pid for pid, pattern in _TEXT_PROBES.items() if pattern.search(text)}
+    matched = set()
+    _PROBE_DB.scan(data, match_event_handler=lambda pid, *_: matched.add(pid))
+    return matched
+
+def extract_features(text: str, author: str) -> dict:
+    """Run the regex heuristics over a single comment's text and author."""
+    probes = scan_text_probes(text)
+    return {
+        'url': _PROBE_URL in probes,
+        'phone': bool(_PHONE_RE.search(text)),
+        'punct': _PROBE_PUNCT in probes or bool(_REPEAT_RE.search(text)),
+        'emoji': 0 if text.isascii() else len(_EMOJI_RE.findall(text)),
+        'promo': _PROBE_PROMO in probes,
+        'userdigit': bool(_USERDIGIT_RE.search(author)),
+        'botname': bool(_BOTNAME_RE.search(author)),
+    }
+
+# Reasons are collected as a bitmask during analysis and only turned into text for the report.
+REASON_URL = 1 << 0
+REASON_LONG_NUMBER = 1 << 1
+REASON_PUNCTUATION = 1 << 2
+REASON_EMOJI = 1 << 3
+REASON_GENERIC = 1 << 4
+REASON_PROMO = 1 << 5
+REASON_HIGH_LIKES = 1 << 6
+REASON_AUTHOR_DIGITS = 1 << 7
+REASON_SHORT_USERNAME = 1 << 8
+REASON_BOT_USERNAME = 1 << 9
+REASON_LANG_UNKNOWN = 1 << 10
+REASON_LANG_UNEXPECTED = 1 << 11
+
+# In report order; dicts keep insertion order.
+_REASON_STRINGS = {
+    REASON_URL: 'Contains a URL or web link (common in spam).',
+    REASON_LONG_NUMBER: 'Contains a long numeric sequence (could be phone/ID).',
+    REASON_PUNCTUATION: 'Excessive punctuation or repeated characters.',
+    REASON_EMOJI: 'High emoji density (can indicate low-effort engagement).',
+    REASON_GENERIC: 'Very short or generic praise; often low-effort or bot-like.',
+    REASON_PROMO: 'Self-promotional call-to-action (common spam).',
+    REASON_HIGH_LIKES: 'High likes — social traction suggests authenticity.',
+    REASON_AUTHOR_DIGITS: 'Author name contains many digits / generic pattern (possible bot).',
+    REASON_SHORT_USERNAME: 'Suspiciously short username (could be fake).',
+    REASON_BOT_USERNAME: 'Username contains bot/promo keywords.',
+    REASON_LANG_UNKNOWN: 'Language could not be reliably detected.',
+    REASON_LANG_UNEXPECTED: 'Short comment in an unexpected language for this post (weak signal).',
+}
+
+def reason_texts(reasons: int) -> list:
+    """Expand a reasons bitmask into its human-readable explanations."""
+    return [text for bit, text in _REASON_STRINGS.items() if reasons & bit]
+
+# Report lines for each reason, wrapped once here rather than for every comment.
+_REASON_LINES = {bit: ["- " + ln for text in reason_texts(bit) for ln in textwrap.wrap(text, 110)]
+                 for bit in _REASON_STRINGS}
+
+def needs_language_check(text: str, platform: str) -> bool:
+    """Whether a comment's language can affect its score (short facebook/instagram text)."""
+    return bool(text) and len(text) < 20 and platform in ('facebook', 'instagram')
+
+def analyze_comment(comment: dict, lang: str = None, features: dict = None) -> dict:
     """Analyze a comment for authenticity using heuristics."""
     text = (comment.get('text') or '').strip()
     author = (comment.get('author') or '').strip()
     like = int(comment.get('likeCount') or 0)
     platform = comment.get('platform') or 'unknown'
+    if features is None:
+        features = extract_features(text, author)
 
     score = 60  # Start slightly optimistic
-    reasons = []
+    reasons = 0
 
     # Suspicious tokens: links, phone numbers
-    if re.search(r'https?://|www\.', text):
+    if features['url']:
         score -= 35
-        reasons.append('Contains a URL or web link (common in spam).')
-    if re.search(r'\b\d{7,}\b', text):
+        reasons |= REASON_URL
+    if features['phone']:
         score -= 10
-        reasons.append('Contains a long numeric sequence (could be phone/ID).')
-    if re.search(r'([!?.]){3,}', text) or re.search(r'(.)\1{6,}', text):
+        reasons |= REASON_LONG_NUMBER
+    if features['punct']:
         score -= 8
-        reasons.append('Excessive punctuation or repeated characters.')
-    emoji_count = len(re.findall(r'[\U0001F300-\U0001F6FF\U0001F900-\U0001F9FF\u2600-\u27BF]', text))
-    if emoji_count >= 4:
+        reasons |= REASON_PUNCTUATION
+    if features['emoji'] >= 4:
         score -= 6
-        reasons.append('High emoji density (can indicate low-effort engagement).')
+        reasons |= REASON_EMOJI
     if len(text) <= 4 or text.lower() in ('nice', 'good', 'great', '👍', '🔥'):
         score -= 12
-        reasons.append('Very short or generic praise; often low-effort or bot-like.')
-    if re.search(r'follow me|check my profile|subscribe|dm for|contact me|visit my', text, flags=re.I):
+        reasons |= REASON_GENERIC
+    if features['promo']:
         score -= 30
-        reasons.append('Self-promotional call-to-action (common spam).')
+        reasons |= REASON_PROMO
     if like == 0:
         score -= 4
     elif like >= 25:
         score += 10
-        reasons.append('High likes — social traction suggests authenticity.')
+        reasons |= REASON_HIGH_LIKES
     if author:
         digits = sum(ch.isdigit() for ch in author)
-        if digits >= 3 or re.search(r'user\d{2,}', author, flags=re.I):
+        if digits >= 3 or features['userdigit']:
             score -= 10
-            reasons.append('Author name contains many digits / generic pattern (possible bot).')
+            reasons |= REASON_AUTHOR_DIGITS
         if len(author) <= 2 and author.isalpha():
             score -= 6
-            reasons.append('Suspiciously short username (could be fake).')
-        if re.search(r'(bot|spam|free|promo)', author, flags=re.I):
+            reasons |= REASON_SHORT_USERNAME
+        if features['botname']:
             score -= 20
-            reasons.append('Username contains bot/promo keywords.')
-    lang = detect_language(text) if text else 'unknown'
-    if lang == 'unknown':
-        reasons.append('Language could not be reliably detected.')
-    else:
-        if platform in ('facebook', 'instagram') and lang not in ('en', 'unknown'):
-            if len(text) < 20:
-                score -= 6
-                reasons.append('Short comment in an unexpected language for this post (weak signal).')
+            reasons |= REASON_BOT_USERNAME
+    # Language is only a signal for short facebook/instagram comments not already scored fake,
+    # so detection (the slowest step here) is skipped for everything else; those report None.
+    detected = lang
+    lang = None
+    if score >= 20 and needs_language_check(text, platform):
+        lang = detected or detect_language(text)
+        if lang == 'unknown':
+            reasons |= REASON_LANG_UNKNOWN
+        elif lang != 'en':
+            score -= 6
+            reasons |= REASON_LANG_UNEXPECTED
 
     score = max(0, min(100, score))
     if score >= 60:
@@ -299,35 +538,75 @@ def analyze_comment(comment: dict) -> dict:
         'language': lang
     }
 
+# Below this many comments, process start-up and pickling cost more than they save.
+_PARALLEL_MIN_COMMENTS = 1000
+_PARALLEL_CHUNK = 256
+
+def analyze_comments(comments: list) -> list:
+    """Analyze many comments, spreading large inputs over worker processes in chunks."""
+    if len(comments) < _PARALLEL_MIN_COMMENTS or (os.cpu_count() or 1) < 2:
+        return _analyze_batch(comments)
+    chunks = [comments[i:i + _PARALLEL_CHUNK] for i in range(0, len(comments), _PARALLEL_CHUNK)]
+    with ProcessPoolExecutor() as ex:
+        return [a for part in ex.map(_analyze_batch, chunks) for a in part]
+
+def _analyze_batch(comments: list) -> list:
+    """Analyze a batch of comments, detecting languages for the whole batch at once."""
+    texts = [(c.get('text') or '').strip() for c in comments]
+    authors = [(c.get('author') or '').strip() for c in comments]
+    checked = [i for i, (t, c) in enumerate(zip(texts, comments))
+               if needs_language_check(t, c.get('platform') or 'unknown')]
+    langs = [None] * len(comments)
+    for i, lang in zip(checked, detect_language_batch([texts[i] for i in checked])):
+        langs[i] = lang
+    return [analyze_comment(c, lang, extract_features(t, a))
+            for c, lang, t, a in zip(comments, langs, texts, authors)]
+
 # ----------------- Visualization -----------------
 
-def create_pie_chart(counts: dict) -> BytesIO:
-    """Create a pie chart showing comment authenticity breakdown."""
-    labels = [f"{k} ({v})" for k, v in counts.items() if v > 0]
+def create_pie_chart(counts: dict) -> Drawing:
+    """Create a vector pie chart showing comment authenticity breakdown."""
+    total = sum(counts.values())
+    labels = [f"{k} ({v}, {100 * v / total:.1f}%)" for k, v in counts.items() if v > 0]
     sizes = [v for v in counts.values() if v > 0]
     if not sizes:
         labels = ['No comments']
         sizes = [1]
 
-    fig, ax = plt.subplots(figsize=(4, 4))
-    ax.pie(sizes, labels=labels, autopct='%1.1f%%', colors=['#4CAF50', '#FFC107', '#FF5722', '#D81B60'])
-    ax.set_title('Comment Authenticity Breakdown')
-    buf = BytesIO()
-    plt.tight_layout()
-    fig.savefig(buf, format='png', dpi=150)
-    plt.close(fig)
-    buf.seek(0)
-    return buf
+    drawing = Drawing(80 * mm, 80 * mm)
+    drawing.add(String(40 * mm, 75 * mm, 'Comment Authenticity Breakdown',
+                       fontName='Helvetica', fontSize=9, textAnchor='middle'))
+    pie = Pie()
+    pie.x, pie.y = 20 * mm, 12 * mm
+    pie.width = pie.height = 40 * mm
+    pie.data = sizes
+    pie.labels = labels
+    pie.simpleLabels = 0
+    pie.sideLabels = 1
+    pie.slices.fontName = 'Helvetica'
+    pie.slices.fontSize = 7
+    pie.slices.strokeColor = colors.white
+    for i, hex_color in enumerate(['#4CAF50', '#FFC107', '#FF5722', '#D81B60'][:len(sizes)]):
+        pie.slices[i].fillColor = colors.HexColor(hex_color)
+    drawing.add(pie)
+    return drawing
 
 # ----------------- PDF Report Generation -----------------
 
+class _FastZCompress(pdfdoc.PDFStreamFilterZCompress):
+    """Flate filter at zlib level 1: several times faster than the default for slightly larger pages."""
+    def encode(self, text):
+        if isinstance(text, str):
+            text = text.encode('utf8')
+        return zlib.compress(text, 1)
+
 def generate_pdf_report(source: str, platform: str, analysis_list: list, output_path: str) -> None:
     """Generate a PDF report with comment analysis and a pie chart."""
     counts = {}
     for a in analysis_list:
         counts[a['verdict']] = counts.get(a['verdict'], 0) + 1
 
-    pie_buf = create_pie_chart(counts)
+    pie_chart = create_pie_chart(counts)
     c = canvas.Canvas(output_path, pagesize=A4)
     width, height = A4
     x_margin = 20 * mm
@@ -344,11 +623,8 @@ def generate_pdf_report(source: str, platform: str, analysis_list: list, output_
     c.drawString(x_margin, y, f'Platform: {platform}')
     y -= 10 * mm
 
-    img = ImageReader(pie_buf)
-    img_w = 80 * mm
-    img_h = 80 * mm
-    c.drawImage(img, x_margin, y - img_h, width=img_w, height=img_h)
-    y -= img_h + 6 * mm
+    renderPDF.draw(pie_chart, c, x_margin, y - pie_chart.height)
+    y -= pie_chart.height + 6 * mm
 
     total = len(analysis_list)
     real_count = sum(1 for a in analysis_list if a['verdict'] in ('real', 'likely-real'))
@@ -357,99 +633,106 @@ def generate_pdf_report(source: str, platform: str, analysis_list: list, output_
     c.drawString(x_margin, y, f"Summary: Total comments: {total} — Likely Real: {real_count} — Likely Fake: {fake_count}")
     y -= 8 * mm
 
-    c.setFont('Helvetica-Bold', 10)
+    # Font, size and leading currently in effect on the page; PDF text state carries across
+    # BT/ET blocks, so repeating an unchanged setFont only adds Tf/TL operators to the stream.
+    font_state = [None]
+
+    def set_font(name: str, size: float, leading: float = None) -> None:
+        """Set the canvas font unless the same font and leading are already in effect."""
+        key = (name, size, size * 1.2 if leading is None else leading)
+        if font_state[0] != key:
+            c.setFont(*key)
+            font_state[0] = key
+
+    def new_page() -> float:
+        """Start a fresh page, which resets the font state; returns the top y."""
+        c.showPage()
+        font_state[0] = None
+        return height - 20 * mm
+
+    def draw_lines(lines: list, x: float, y: float, step: float, font: tuple) -> float:
+        """Draw lines as one text object per page, continuing on a fresh page at the bottom margin."""
+        while lines:
+            fit = max(1, int((y - 20 * mm) // step) + 1)
+            set_font(*font, leading=step)
+            textobj = c.beginText(x, y)
+            textobj.textLines(lines[:fit])
+            c.drawText(textobj)
+            y -= step * len(lines[:fit])
+            lines = lines[fit:]
+            if y < 20 * mm:
+                y = new_page()
+                set_font(*font, leading=step)
+        return y
+
+    set_font('Helvetica-Bold', 10)
+    wrapper = textwrap.TextWrapper(width=int((width - 2 * x_margin) / 6.5))
     for i, a in enumerate(analysis_list, start=1):
         if y < 40 * mm:
-            c.showPage()
-            y = height - 20 * mm
-            c.setFont('Helvetica-Bold', 12)
+            y = new_page()
+            set_font('Helvetica-Bold', 12)
         title = f"{i}. [{a['platform']}] {a['author']} — {a['verdict'].upper()} (score {a['score']})"
         c.drawString(x_margin, y, title)
         y -= 5 * mm
-        c.setFont('Helvetica', 9)
-        text = a['text'] or ''
-        wrap_width = int((width - 2 * x_margin) / 6.5)
-        for start in range(0, len(text), wrap_width):
-            c.drawString(x_margin + 6 * mm, y, text[start:start+wrap_width])
-            y -= 4.5 * mm
+        text_lines = wrapper.wrap(a['text'] or '')
+        y = draw_lines(text_lines, x_margin + 6 * mm, y, 4.5 * mm, ('Helvetica', 9))
         if a['reasons']:
-            c.setFont('Helvetica-Oblique', 8)
-            for r in a['reasons']:
-                for start in range(0, len(r), 110):
-                    c.drawString(x_margin + 8 * mm, y, "- " + r[start:start+110])
-                    y -= 4 * mm
+            reason_lines = [ln for bit, lines in _REASON_LINES.items() if a['reasons'] & bit for ln in lines]
+            y = draw_lines(reason_lines, x_margin + 8 * mm, y, 4 * mm, ('Helvetica-Oblique', 8))
             y -= 2 * mm
         else:
-            c.setFont('Helvetica-Oblique', 8)
+            set_font('Helvetica-Oblique', 8, 4 * mm)
             c.drawString(x_margin + 6 * mm, y, "Why: No specific flags detected (manual review recommended).")
             y -= 6 * mm
         y -= 4 * mm
-        c.setFont('Helvetica', 9)
+        # Same leading as the comment text below the next title, so that text needs no font change.
+        set_font('Helvetica', 9, 4.5 * mm)
 
-    c.save()
+    # Page streams are deflated inside save() through pdfdoc's shared filter; swap it just for this call.
+    default_filter, pdfdoc.PDFZCompress = pdfdoc.PDFZCompress, _FastZCompress()
+    try:
+        c.save()
+    finally:
+        pdfdoc.PDFZCompress = default_filter
     print(f"✅ [Report] Saved to {output_path}")
 
 # ----------------- Orchestration -----------------
 
-def process_url(url: str, args: argparse.Namespace) -> tuple:
-    """Process a URL to fetch comments or load demo comments if needed."""
+# platform -> (log label, token env vars in priority order, token name, ID extractor, ID name, fetcher)
+_PLATFORM_DISPATCH = {
+    'youtube': ('YouTube', ('YOUTUBE_API_KEY',), 'API key',
+                extract_youtube_id, 'video ID', fetch_youtube_comments),
+    'facebook': ('Facebook', ('FACEBOOK_ACCESS_TOKEN',), 'access token',
+                 lambda u: u.split('/')[-1] if '/' in u else None, 'post ID', fetch_facebook_comments),
+    'instagram': ('Instagram', ('FACEBOOK_ACCESS_TOKEN',), 'access token',
+                  lambda u: u.split('/')[-2] if '/p/' in u else None, 'media ID', fetch_instagram_comments),
+    'x': ('X/Twitter', ('TWITTER_BEARER_TOKEN', 'TWITTER_BEARER', 'TWITTER_TOKEN'), 'bearer token',
+          lambda u: u.split('/status/')[-1] if '/status/' in u else None, 'tweet ID', fetch_x_comments),
+    'linkedin': ('LinkedIn', ('LINKEDIN_ACCESS_TOKEN',), 'access token',
+                 lambda u: u.split('/')[-1] if '/' in u else None, 'URN', fetch_linkedin_comments),
+}
+
+def process_url(url: str, args: argparse.Namespace, on_page=None) -> tuple:
+    """Process a URL to fetch comments or load demo comments if needed.
+
+    Fetched pages are also passed to on_page as they arrive; demo comments are not.
+    """
     platform = detect_platform_from_url(url)
     collected = []
 
-    yt_key = os.getenv('YOUTUBE_API_KEY')
-    fb_token = os.getenv('FACEBOOK_ACCESS_TOKEN')
-    tw_bearer = os.getenv('TWITTER_BEARER_TOKEN') or os.getenv('TWITTER_BEARER') or os.getenv('TWITTER_TOKEN')
-    ln_token = os.getenv('LINKEDIN_ACCESS_TOKEN')
-
-    if platform == 'youtube':
-        vid = extract_youtube_id(url)
-        if vid and yt_key:
-            print("ℹ️ [YouTube] Fetching comments via API...")
-            collected = fetch_youtube_comments(vid, yt_key, max_results=args.max)
-        else:
-            print("⚠️ [YouTube] Invalid video ID or missing API key.")
-    elif platform == 'facebook':
-        if fb_token:
-            object_id = url.split('/')[-1] if '/' in url else None
-            if object_id:
-                print("ℹ️ [Facebook] Fetching comments via API...")
-                collected = fetch_facebook_comments(object_id, fb_token, max_results=args.max)
-            else:
-                print("⚠️ [Facebook] Could not extract post ID from URL.")
-        else:
-            print("⚠️ [Facebook] Missing access token.")
-    elif platform == 'instagram':
-        if fb_token:
-            media_id = url.split('/')[-2] if '/p/' in url else None
-            if media_id:
-                print("ℹ️ [Instagram] Fetching comments via API...")
-                collected = fetch_instagram_comments(media_id, fb_token, max_results=args.max)
-            else:
-                print("⚠️ [Instagram] Could not extract media ID from URL.")
-        else:
-            print("⚠️ [Instagram] Missing access token.")
-    elif platform == 'x':
-        if tw_bearer:
-            tweet_id = url.split('/status/')[-1] if '/status/' in url else None
-            if tweet_id:
-                print("ℹ️ [X/Twitter] Fetching comments via API...")
-                collected = fetch_x_comments(tweet_id, tw_bearer, max_results=args.max)
-            else:
-                print("⚠️ [X/Twitter] Could not extract tweet ID from URL.")
-        else:
-            print("⚠️ [X/Twitter] Missing bearer token.")
-    elif platform == 'linkedin':
-        if ln_token:
-            urn = url.split('/')[-1] if '/' in url else None
-            if urn:
-                print("ℹ️ [LinkedIn] Fetching comments via API...")
-                collected = fetch_linkedin_comments(urn, ln_token, max_results=args.max)
-            else:
-                print("⚠️ [LinkedIn] Could not extract URN from URL.")
-        else:
-            print("⚠️ [LinkedIn] Missing access token.")
-    else:
+    entry = _PLATFORM_DISPATCH.get(platform)
+    if entry is None:
         print("❌ [Error] Unknown platform.")
+    else:
+        label, env_names, token_name, extract_id, id_name, fetcher = entry
+        token = next(filter(None, map(os.getenv, env_names)), None)
+        if not token:
+            print(f"⚠️ [{label}] Missing {token_name}.")
+        elif not (item_id := extract_id(url)):
+            print(f"⚠️ [{label}] Could not extract {id_name} from URL.")
+        else:
+            print(f"ℹ️ [{label}] Fetching comments via API...")
+            collected = fetcher(item_id, token, max_results=args.max, on_page=on_page)
 
     if not collected:
         collected = load_sample_comments(platform)
@@ -481,6 +764,12 @@ def main():
     platform = 'unknown'
     source = ""
     args = argparse.Namespace(max=200)
+    # Analyze each fetched page on a worker thread while the next page downloads.
+    pool = ThreadPoolExecutor(max_workers=1)
+    pending = []
+
+    def on_page(page: list) -> None:
+        pending.append(pool.submit(analyze_comments, page))
 
     if choice == "1":
         source = input("📄 Enter the path to your CSV file: ").strip()
@@ -489,26 +778,28 @@ def main():
             platform = collected[0].get('platform')
     elif choice == "2":
         source = input("📺 Enter YouTube video URL: ").strip()
-        platform, collected = process_url(source, args)
+        platform, collected = process_url(source, args, on_page)
     elif choice == "3":
         source = input("📘 Enter Facebook post URL: ").strip()
-        platform, collected = process_url(source, args)
+        platform, collected = process_url(source, args, on_page)
     elif choice == "4":
         source = input("📸 Enter Instagram post URL: ").strip()
-        platform, collected = process_url(source, args)
+        platform, collected = process_url(source, args, on_page)
     elif choice == "5":
         source = input("🐦 Enter X/Twitter post URL: ").strip()
-        platform, collected = process_url(source, args)
+        platform, collected = process_url(source, args, on_page)
     elif choice == "6":
         source = input("💼 Enter LinkedIn post URL: ").strip()
-        platform, collected = process_url(source, args)
+        platform, collected = process_url(source, args, on_page)
 
     if not collected:
         print("❌ No comments collected. Please check your input or API keys and try again.")
         sys.exit(1)
 
     print(f"\nℹ️ Collected {len(collected)} comments. Analyzing...")
-    analysis = [analyze_comment(c) for c in collected]
+    # Demo comments only come back when no fetched page had any comments.
+    analysis = [a for f in pending for a in f.result()] or analyze_comments(collected)
+    pool.shutdown()
     analysis_sorted = sorted(analysis, key=lambda x: x['score'])
 
     out_file = "comment_report.pdf"